@@ -1,7 +1,8 @@
 __author__ = ["chrisholder", "TonyBagnall"]
 
+import collections.abc
 import inspect
-from typing import Callable, List, Union
+from typing import Callable, List, Union, get_origin
 
 import numpy as np
 
@@ -193,12 +194,8 @@ def _is_distance_factory_callable(metric: Callable) -> bool:
         return False
     correct_num_params = len(inspect.signature(metric).parameters) >= 2
     return_type = inspect.signature(metric).return_annotation
-    return_num_params = (
-        return_type is not float
-        and hasattr(return_type, "__len__")
-        and len(return_type) == 1
-    )
-    return correct_num_params and return_num_params
+    returns_callable = get_origin(return_type) is collections.abc.Callable
+    return correct_num_params and returns_callable
 
 
 def _is_no_python_distance_callable(metric: Callable) -> bool:
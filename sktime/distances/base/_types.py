@@ -13,7 +13,7 @@ from typing import Callable, List, Tuple, Union
 import numpy as np
 
 # Callable types
-DistanceCallable = (Callable[[np.ndarray, np.ndarray], float],)
+DistanceCallable = Callable[[np.ndarray, np.ndarray], float]
 AlignmentPathReturn = Union[
     Tuple[List[Tuple], float], Tuple[List[Tuple], float, np.ndarray]
 ]
@@ -24,7 +24,7 @@ DistanceFactoryCallable = Callable[
 DistancePairwiseCallable = Callable[[np.ndarray, np.ndarray], np.ndarray]
 
 ValidCallableTypes = Union[
-    Callable[[np.ndarray, np.ndarray], float],
-    Callable[[np.ndarray, np.ndarray], np.ndarray],
-    Callable[[np.ndarray, np.ndarray, dict], Callable[[np.ndarray, np.ndarray], float]],
+    DistanceCallable,
+    DistancePairwiseCallable,
+    DistanceFactoryCallable,
 ]
@@ -280,32 +280,33 @@ def test__check_regressor_input():
 
 def _create_example_dataframe(cases=5, dimensions=1, length=10):
     """Create a simple data frame set of time series (X) for testing."""
-    test_X = pd.DataFrame(dtype=np.float32)
-    for i in range(0, dimensions):
-        instance_list = []
-        for _ in range(0, cases):
-            instance_list.append(pd.Series(np.random.randn(length)))
-        test_X["dimension_" + str(i)] = instance_list
+    data = np.random.randn(dimensions, cases, length)
+    test_X = pd.DataFrame(
+        {
+            "dimension_" + str(i): [pd.Series(data[i, j]) for j in range(cases)]
+            for i in range(dimensions)
+        }
+    )
     return test_X
 
 
 def _create_nested_dataframe(cases=5, dimensions=1, length=10):
-    testy = pd.DataFrame(dtype=np.float32)
-    for i in range(0, dimensions):
-        instance_list = []
-        for _ in range(0, cases):
-            instance_list.append(pd.Series(np.random.randn(length)))
-        testy["dimension_" + str(i + 1)] = instance_list
+    data = np.random.randn(dimensions, cases, length)
+    testy = pd.DataFrame(
+        {
+            "dimension_" + str(i + 1): [pd.Series(data[i, j]) for j in range(cases)]
+            for i in range(dimensions)
+        }
+    )
     return testy
 
 
 def _create_unequal_length_nested_dataframe(cases=5, dimensions=1, length=10):
-    testy = pd.DataFrame(dtype=np.float32)
+    data = np.random.randn(dimensions, cases, length)
+    testy = pd.DataFrame()
     for i in range(0, dimensions):
-        instance_list = []
-        for _ in range(0, cases - 1):
-            instance_list.append(pd.Series(np.random.randn(length)))
-        instance_list.append(pd.Series(np.random.randn(length - 1)))
+        instance_list = [pd.Series(data[i, j]) for j in range(cases - 1)]
+        instance_list.append(pd.Series(data[i, -1, :-1]))
         testy["dimension_" + str(i + 1)] = instance_list
 
     return testy
@@ -11,13 +11,18 @@ from warnings import warn
 
 import numpy as np
 import pandas as pd
+from joblib import parallel_backend
 from sklearn.compose import ColumnTransformer as _ColumnTransformer
 
 from sktime.transformations.base import BaseTransformer, _PanelToPanelTransformer
 from sktime.utils.dependencies import _check_soft_dependencies
-from sktime.utils.multiindex import flatten_multiindex
+from sktime.utils.multiindex import underscore_join
 from sktime.utils.validation.panel import check_X
 
+# ColumnTransformer relies on internals of sklearn.compose.ColumnTransformer
+# that changed in scikit-learn 1.4; checked once at import, not per instance
+_SKLEARN_LT_14 = _check_soft_dependencies("sklearn<1.4", severity="none")
+
 
 class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
     """Column-wise application of transformers.
@@ -72,10 +77,12 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
         lower than this value. Use ``sparse_threshold=0`` to always return
         dense.  When the transformed output consists of all dense data, the
         stacked result will be dense, and this keyword will be ignored.
-    n_jobs : int or None, optional (default=None)
+    n_jobs : int or None, optional (default=1)
         Number of jobs to run in parallel.
         ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
         ``-1`` means using all processors.
+        In ``transform``, jobs are run in threads of the joblib ``"threading"``
+        backend, to avoid copying the data to worker processes.
     transformer_weights : dict, optional
         Multiplicative weights for features per transformer. The output of the
         transformer is multiplied by these weights. Keys are transformer names,
@@ -83,6 +90,10 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
     preserve_dataframe : boolean
         If True, pandas dataframe is returned.
         If False, numpy array is returned.
+    sparse_output_format : str, default = "csr"
+        scipy sparse matrix format of the output, if the output is sparse,
+        e.g., ``"csr"``, ``"csc"``, or ``"coo"``. The format is passed to
+        ``scipy.sparse.hstack``, which then builds the output in a single pass.
 
     Attributes
     ----------
@@ -120,8 +131,10 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
         n_jobs=1,
         transformer_weights=None,
         preserve_dataframe=True,
+        sparse_output_format="csr",
     ):
         self.preserve_dataframe = preserve_dataframe
+        self.sparse_output_format = sparse_output_format
 
         warn(
             "ColumnTransformer is not fully compliant with the sktime interface "
@@ -133,7 +146,7 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
             "ColumnTransformer can simply be replaced by ColumnEnsembleTransformer."
         )
 
-        if not _check_soft_dependencies("sklearn<1.4", severity="none"):
+        if not _SKLEARN_LT_14:
             raise ModuleNotFoundError(
                 "ColumnTransformer is not fully compliant with the sktime interface "
                 "and distributed only for reasons of downwards compatibility. "
@@ -161,23 +174,42 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
 
         Supports input types (X): list of numpy arrays, sparse arrays and DataFrames
         """
-        types = {type(X) for X in Xs}
+        from scipy import sparse
+
+        if len(Xs) == 1:
+            # a single output needs no stacking, return it without copying
+            Xt = Xs[0]
+            if self.sparse_output_:
+                return Xt.asformat(self.sparse_output_format)
+            if isinstance(Xt, np.ndarray):
+                return Xt
+            if (
+                isinstance(Xt, pd.DataFrame)
+                and self.preserve_dataframe
+                and self._get_vars_unique()
+            ):
+                return Xt
 
         if self.sparse_output_:
-            from scipy import sparse
+            return sparse.hstack(Xs, format=self.sparse_output_format)
 
-            return sparse.hstack(Xs).tocsr()
+        types = {type(X) for X in Xs}
         if self.preserve_dataframe and (pd.Series in types or pd.DataFrame in types):
-            vars = [y for x in self.transformers for y in x[2]]
-            vars_unique = len(set(vars)) == len(vars)
-            names = [str(x[0]) for x in self.transformers]
-            if vars_unique:
-                return pd.concat(Xs, axis="columns")
-            else:
-                Xt = pd.concat(Xs, axis="columns", keys=names)
-                Xt.columns = flatten_multiindex(Xt.columns)
-                return Xt
-        return np.hstack(Xs)
+            # transformer outputs are not used after stacking, no need to copy
+            Xt = pd.concat(Xs, axis="columns", copy=False)
+            if not self._get_vars_unique():
+                # prefix columns with the name of the transformer producing them
+                Xt.columns = [
+                    underscore_join([name, col])
+                    for name, X in zip(self._get_output_names(), Xs)
+                    for col in X.columns
+                ]
+            return Xt
+
+        # outputs are stacked as columns into one newly allocated array,
+        # sparse outputs are densified first as the output is dense
+        Xs = [X.toarray() if sparse.issparse(X) else X for X in Xs]
+        return np.column_stack(Xs)
 
     def _validate_output(self, result):
         """Validate output of every transformer.
@@ -187,16 +219,38 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
 
         Output can also be a pd.Series which is actually a 1D
         """
-        names = [
-            name for name, _, _, _ in self._iter(fitted=True, replace_strings=True)
-        ]
-        for Xs, name in zip(result, names):
+        for Xs, name in zip(result, self._get_output_names()):
             if not (getattr(Xs, "ndim", 0) == 2 or isinstance(Xs, pd.Series)):
                 raise ValueError(
                     "The output of the '{}' transformer should be 2D (scipy "
                     "matrix, array, or pandas DataFrame).".format(name)
                 )
 
+    def _get_vars_unique(self):
+        """Return whether the columns selected by the transformers are unique.
+
+        Only evaluated when stacking DataFrame outputs, as the column specifications
+        are then list-likes of column labels. It depends only on
+        ``self.transformers``, so is computed on first use after fit.
+        """
+        if self._vars_unique is None:
+            vars = [y for x in self.transformers for y in x[2]]
+            self._vars_unique = len(set(vars)) == len(vars)
+        return self._vars_unique
+
+    def _get_output_names(self):
+        """Return names of the transformers whose outputs are stacked, in order.
+
+        These are the transformers generated by ``_iter`` over the fitted
+        transformers, i.e., excluding dropped ones and including the remainder.
+        They are fixed once fitted, so are computed on first use after fit.
+        """
+        if self._output_names is None:
+            self._output_names = [
+                name for name, _, _, _ in self._iter(fitted=True, replace_strings=True)
+            ]
+        return self._output_names
+
     @classmethod
     def get_test_params(cls):
         """Return testing parameter settings for the estimator.
@@ -217,13 +271,21 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
             ("transformer2", ExponentTransformer()),
         ]
 
-        return {
+        params1 = {
             "transformers": [(name, estimator, [0]) for name, estimator in TRANSFORMERS]
         }
+        # the output here is dense, so sparse_output_format is only exercised
+        # by construction and cloning; sparse output is tested in test_compose
+        params2 = {
+            "transformers": [("transformer1", ExponentTransformer(), [0])],
+            "remainder": "passthrough",
+            "sparse_output_format": "csc",
+        }
+        return [params1, params2]
 
     def fit(self, X, y=None):
         """Fit the transformer."""
-        X = check_X(X, coerce_to_pandas=True)
+        # sklearn's fit calls fit_transform, which checks and coerces X
         super().fit(X, y)
         self._is_fitted = True
         return self
@@ -232,10 +294,24 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
         """Transform the data."""
         self.check_is_fitted()
         X = check_X(X, coerce_to_pandas=True)
-        return super().transform(X)
+        if self.n_jobs in (None, 1):
+            return super().transform(X)
+
+        # fitted transformers are applied to column subsets of the same panel,
+        # threads avoid pickling the nested DataFrame to worker processes
+        with parallel_backend("threading", n_jobs=self.n_jobs):
+            return super().transform(X)
 
     def fit_transform(self, X, y=None):
         """Fit and transform, shorthand."""
+        X = check_X(X, coerce_to_pandas=True)
+
+        # fit routes through fit_transform, and _hstack is first called from the
+        # super call below; the column bookkeeping it needs is reset here,
+        # and set on first use once the fitted transformers are known
+        self._vars_unique = None
+        self._output_names = None
+
         # Wrap fit_transform to set _is_fitted attribute
         Xt = super().fit_transform(X, y)
         self._is_fitted = True
@@ -249,8 +325,6 @@ class ColumnConcatenator(BaseTransformer):
     into single univariate time series/panel data by concatenating
     each individual series on top of each other from left to right.
 
-    Uses pandas method stack() to do the concatenating
-
     Examples
     --------
     >>> from sktime.transformations.panel.compose import ColumnConcatenator # noqa: E501
@@ -309,15 +383,54 @@ class ColumnConcatenator(BaseTransformer):
           Transformed pandas DataFrame with same number of rows and single
           column
         """
-        Xst = pd.DataFrame(X.stack())
-        Xt = Xst.swaplevel(-2, -1).sort_index().droplevel(-2)
+        n_columns = X.shape[1]
+        values = X.to_numpy()
+
+        # all index levels but the last identify the instance
+        inst_idx = X.index.droplevel(-1)
+        codes, instances = pd.factorize(inst_idx, sort=True)
+        counts = np.bincount(codes)
+        starts = np.cumsum(counts) - counts
+
+        # instance i occupies n_columns * counts[i] consecutive rows of the output,
+        # holding its series for each column in turn, from left to right
+        equal_length = len(counts) > 0 and np.all(counts == counts[0])
+        if equal_length and np.all(codes[1:] >= codes[:-1]):
+            # common case of equal length instances stored contiguously,
+            # the output is a reshape of values to (instance, column, time)
+            Xt_values = values.reshape(len(counts), counts[0], n_columns)
+            Xt_values = Xt_values.transpose(0, 2, 1).reshape(-1)
+        else:
+            # position of each row within its instance, in order of appearance
+            order = np.argsort(codes, kind="stable")
+            t_local = np.empty(len(codes), dtype=np.intp)
+            t_local[order] = np.arange(len(codes)) - np.repeat(starts, counts)
+
+            pos = starts[codes] * n_columns + t_local
+            step = counts[codes]
+            Xt_values = np.empty(len(codes) * n_columns, dtype=values.dtype)
+            for i in range(n_columns):
+                Xt_values[pos + i * step] = values[:, i]
 
-        # the above has the right structure, but the wrong index
         # the time index is in general non-unique now, we replace it by integer index
-        inst_idx = Xt.index.get_level_values(0)
-        t_idx = [range(len(Xt.loc[x])) for x in inst_idx.unique()]
-        t_idx = np.concatenate(t_idx)
-
-        Xt.index = pd.MultiIndex.from_arrays([inst_idx, t_idx])
-        Xt.index.names = X.index.names
+        out_counts = counts * n_columns
+        out_starts = starts * n_columns
+        t_idx = np.arange(len(Xt_values)) - np.repeat(out_starts, out_counts)
+
+        # levels and codes are known from the factorization above, so the index
+        # is assembled directly instead of factorizing the level values again
+        inst_codes = np.repeat(np.arange(len(instances)), out_counts)
+        if isinstance(instances, pd.MultiIndex):
+            levels = list(instances.levels)
+            codes = [level_codes[inst_codes] for level_codes in instances.codes]
+        else:
+            levels = [instances]
+            codes = [inst_codes]
+        levels.append(pd.RangeIndex(out_counts.max(initial=0)))
+        codes.append(t_idx)
+
+        index = pd.MultiIndex(
+            levels=levels, codes=codes, names=X.index.names, verify_integrity=False
+        )
+        Xt = pd.DataFrame(Xt_values, index=index)
         return Xt
@@ -1,11 +1,13 @@
 """Column concatenator test code."""
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from sktime.datasets import load_basic_motions
 from sktime.tests.test_switch import run_test_for_class
 from sktime.transformations.panel.compose import ColumnConcatenator
+from sktime.utils._testing.hierarchical import _make_hierarchical
 
 
 @pytest.mark.skipif(
@@ -33,3 +35,76 @@ def test_TimeSeriesConcatenator():
     # check specific observations
     assert X.iloc[0, -1].iloc[-3] == Xt.iloc[0, 0].iloc[-3]
     assert X.iloc[0, 0].iloc[3] == Xt.iloc[0, 0].iloc[3]
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ColumnConcatenator),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_ColumnConcatenator_order():
+    """Test that columns are concatenated left to right, per instance."""
+    idx = pd.MultiIndex.from_product([[0, 1], [0, 1, 2]], names=["inst", "time"])
+    X = pd.DataFrame({"b": [1, 2, 3, 4, 5, 6], "a": [7, 8, 9, 10, 11, 12]}, index=idx)
+
+    Xt = ColumnConcatenator().fit_transform(X)
+
+    expected_idx = pd.MultiIndex.from_product([[0, 1], range(6)], names=X.index.names)
+    expected = pd.DataFrame([1, 2, 3, 7, 8, 9, 4, 5, 6, 10, 11, 12], index=expected_idx)
+    pd.testing.assert_frame_equal(Xt, expected)
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ColumnConcatenator),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_ColumnConcatenator_hierarchical():
+    """Test the time series concatenator on hierarchical data."""
+    X = _make_hierarchical(
+        hierarchy_levels=(2, 3), n_columns=2, min_timepoints=3, max_timepoints=5
+    )
+
+    Xt = ColumnConcatenator().fit_transform(X)
+
+    assert Xt.shape == (2 * len(X), 1)
+    assert Xt.index.names == X.index.names
+    assert Xt.loc[("h0_1", "h1_2")].shape[0] == 2 * X.loc[("h0_1", "h1_2")].shape[0]
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ColumnConcatenator),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_ColumnConcatenator_unequal_length():
+    """Test the time series concatenator on instances of unequal length."""
+    idx = pd.MultiIndex.from_tuples(
+        [(0, 0), (0, 1), (1, 0), (1, 1), (1, 2)], names=["inst", "time"]
+    )
+    X = pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [6, 7, 8, 9, 10]}, index=idx)
+
+    Xt = ColumnConcatenator().fit_transform(X)
+
+    expected_idx = pd.MultiIndex.from_tuples(
+        [(0, t) for t in range(4)] + [(1, t) for t in range(6)], names=X.index.names
+    )
+    expected = pd.DataFrame([1, 2, 6, 7, 3, 4, 5, 8, 9, 10], index=expected_idx)
+    pd.testing.assert_frame_equal(Xt, expected)
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ColumnConcatenator),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_ColumnConcatenator_nan():
+    """Test that missing values are kept in place by the concatenator."""
+    idx = pd.MultiIndex.from_product([[0, 1], [0, 1]], names=["inst", "time"])
+    X = pd.DataFrame(
+        {"a": [1.0, np.nan, 3.0, 4.0], "b": [5.0, 6.0, np.nan, 8.0]}, index=idx
+    )
+
+    Xt = ColumnConcatenator().fit_transform(X)
+
+    expected_idx = pd.MultiIndex.from_product([[0, 1], range(4)], names=X.index.names)
+    expected = pd.DataFrame(
+        [1.0, np.nan, 5.0, 6.0, 3.0, 4.0, np.nan, 8.0], index=expected_idx
+    )
+    pd.testing.assert_frame_equal(Xt, expected)
@@ -1,11 +1,16 @@
 """Tests for panel compositors."""
+import os
+import threading
+
 import numpy as np
+import pandas as pd
 import pytest
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import FunctionTransformer
 
 from sktime.datasets import load_basic_motions
+from sktime.datatypes._panel._convert import from_nested_to_3d_numpy
 from sktime.tests.test_switch import run_test_for_class
 from sktime.transformations.panel.compose import ColumnTransformer
 from sktime.transformations.panel.reduce import Tabularizer
@@ -40,3 +45,189 @@ def test_ColumnTransformer_pipeline():
     y_pred = model.predict(X_test)
     assert y_pred.shape[0] == y_test.shape[0]
     np.testing.assert_array_equal(np.unique(y_pred), np.unique(y_test))
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ColumnTransformer),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_ColumnTransformer_duplicate_columns():
+    """Test output column names of ColumnTransformer for overlapping columns."""
+    X, _ = load_basic_motions(split="train", return_X_y=True)
+
+    def id_func(X):
+        return X
+
+    column_transformer = ColumnTransformer(
+        [
+            ("id0", FunctionTransformer(func=id_func, validate=False), ["dim_0"]),
+            ("drop", "drop", ["dim_1"]),
+            ("id1", FunctionTransformer(func=id_func, validate=False), ["dim_0"]),
+        ],
+        remainder="passthrough",
+    )
+    Xt = column_transformer.fit_transform(X)
+
+    expected = ["id0__dim_0", "id1__dim_0"]
+    expected += [f"remainder__dim_{i}" for i in range(2, 6)]
+    assert Xt.columns.to_list() == expected
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ColumnTransformer),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+@pytest.mark.parametrize("columns", [slice(0, 2), lambda X: ["dim_0", "dim_1"]])
+def test_ColumnTransformer_slice_and_callable_columns(columns):
+    """Test ColumnTransformer with slice and callable column selections."""
+    X, _ = load_basic_motions(split="train", return_X_y=True)
+
+    def first_value(X):
+        return X.iloc[:, 0].map(lambda s: s.iloc[0]).to_numpy()[:, None]
+
+    column_transformer = ColumnTransformer(
+        [("first", FunctionTransformer(func=first_value, validate=False), columns)],
+        preserve_dataframe=False,
+    )
+    Xt = column_transformer.fit_transform(X)
+    assert isinstance(Xt, np.ndarray)
+    assert Xt.shape == (X.shape[0], 1)
+
+    Xt = column_transformer.transform(X)
+    assert Xt.shape == (X.shape[0], 1)
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ColumnTransformer),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+@pytest.mark.parametrize("n_transformers", [1, 2])
+@pytest.mark.parametrize("sparse_output_format", ["csr", "csc", "coo"])
+def test_ColumnTransformer_sparse_output_format(sparse_output_format, n_transformers):
+    """Test that sparse output of ColumnTransformer has the requested format."""
+    from scipy import sparse
+
+    X, _ = load_basic_motions(split="train", return_X_y=True)
+
+    def to_sparse(X):
+        return sparse.csr_matrix(np.eye(X.shape[0], 3))
+
+    transformers = [
+        (f"sparse{i}", FunctionTransformer(func=to_sparse, validate=False), [i])
+        for i in range(n_transformers)
+    ]
+    column_transformer = ColumnTransformer(
+        transformers,
+        sparse_threshold=1.0,
+        sparse_output_format=sparse_output_format,
+    )
+    Xt = column_transformer.fit_transform(X)
+    assert sparse.issparse(Xt)
+    assert Xt.format == sparse_output_format
+    assert Xt.shape == (X.shape[0], 3 * n_transformers)
+
+    Xt = column_transformer.transform(X)
+    assert Xt.format == sparse_output_format
+
+
+# (process id, thread) of each call to _record_worker, module level so that
+# transformers fitted in worker processes refer to the same list when unpickled
+_WORKERS = []
+
+
+def _record_worker(X):
+    _WORKERS.append((os.getpid(), threading.current_thread()))
+    return X
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ColumnTransformer),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_ColumnTransformer_n_jobs():
+    """Test that transform with n_jobs=2 runs in threads and matches n_jobs=1."""
+    X, _ = load_basic_motions(split="train", return_X_y=True)
+
+    transformers = [
+        (f"id{i}", FunctionTransformer(func=_record_worker, validate=False), [col])
+        for i, col in enumerate(X.columns)
+    ]
+    Xt_expected = ColumnTransformer(transformers, n_jobs=1).fit(X).transform(X)
+
+    column_transformer = ColumnTransformer(transformers, n_jobs=2).fit(X)
+    _WORKERS.clear()
+    Xt = column_transformer.transform(X)
+
+    pd.testing.assert_frame_equal(Xt, Xt_expected)
+    assert len(_WORKERS) == len(transformers)
+    assert all(pid == os.getpid() for pid, _ in _WORKERS)
+    assert all(thread is not threading.main_thread() for _, thread in _WORKERS)
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ColumnTransformer),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_ColumnTransformer_dense_and_sparse_output():
+    """Test that mixed dense and sparse outputs are stacked to a dense array."""
+    from scipy import sparse
+
+    X, _ = load_basic_motions(split="train", return_X_y=True)
+
+    def first_value(X):
+        return X.iloc[:, 0].map(lambda s: s.iloc[0]).to_numpy()[:, None]
+
+    def to_sparse(X):
+        return sparse.csr_matrix(np.eye(X.shape[0], 3))
+
+    column_transformer = ColumnTransformer(
+        [
+            ("dense", FunctionTransformer(func=first_value, validate=False), [0]),
+            ("sparse", FunctionTransformer(func=to_sparse, validate=False), [1]),
+        ],
+        sparse_threshold=0,
+        preserve_dataframe=False,
+    )
+    Xt = column_transformer.fit_transform(X)
+
+    assert isinstance(Xt, np.ndarray)
+    assert Xt.shape == (X.shape[0], 4)
+    np.testing.assert_array_equal(Xt[:, 1:], np.eye(X.shape[0], 3))
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ColumnTransformer),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_ColumnTransformer_fit_transform_numpy3D():
+    """Test that fit_transform on numpy3D input matches fit, then transform."""
+    X = np.random.default_rng(42).normal(size=(4, 3, 5))
+
+    def id_func(X):
+        return X
+
+    transformers = [
+        ("id0", FunctionTransformer(func=id_func, validate=False), [0]),
+        ("id1", FunctionTransformer(func=id_func, validate=False), [1, 2]),
+    ]
+    Xt = ColumnTransformer(transformers).fit_transform(X)
+    Xt_expected = ColumnTransformer(transformers).fit(X).transform(X)
+
+    np.testing.assert_array_equal(
+        from_nested_to_3d_numpy(Xt), from_nested_to_3d_numpy(Xt_expected)
+    )
+    np.testing.assert_array_equal(from_nested_to_3d_numpy(Xt), X)
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ColumnTransformer),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_ColumnTransformer_fit_transform_not_nested():
+    """Test that fit_transform raises an error for a non-nested DataFrame."""
+    X = pd.DataFrame(np.ones((3, 2)))
+    column_transformer = ColumnTransformer(
+        [("id", FunctionTransformer(validate=False), [0])]
+    )
+    with pytest.raises(ValueError, match="nested pd.DataFrame"):
+        column_transformer.fit_transform(X)